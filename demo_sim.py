@@ -9,6 +9,7 @@ Usage:
     python demo_sim.py                  Interactive mode (default)
     python demo_sim.py --resolve-all    Quick-resolve all active alerts
     python demo_sim.py --setup-oim      Configure the BigPanda OIM integration
+    python demo_sim.py --quiet          One-line summaries instead of payload/sent-alert tables
 
 Environment Variables (set in .env):
     BIGPANDA_ORG_ACCESS_TOKEN  - Bearer token (Org Token) for BigPanda API
@@ -17,24 +18,38 @@ Environment Variables (set in .env):
 """
 
 import os
+import re
 import sys
 import json
 import time
+import uuid
+import hashlib
+import threading
 import argparse
+import functools
+import importlib.util
 import requests
-from datetime import datetime, timezone, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
 from pathlib import Path
 
 # ─── Dependency Check ────────────────────────────────────────────────────────
+# openai is only needed when generating alerts, so it is checked for here but
+# imported lazily — --resolve-all and --setup-oim never pay its import cost
+# (compare with: python -X importtime demo_sim.py --resolve-all).
 try:
+    import orjson
     from dotenv import load_dotenv
-    from openai import OpenAI
+    if importlib.util.find_spec("openai") is None:
+        raise ImportError("openai")
     from rich.console import Console
     from rich.table import Table
     from rich.panel import Panel
-    from rich.prompt import Prompt, IntPrompt, Confirm
+    from rich.prompt import Prompt, Confirm
     from rich.text import Text
-    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from rich.progress import Progress, SpinnerColumn, TextColumn, MofNCompleteColumn
     from rich import box
 except ImportError:
     print("\n[ERROR] Missing dependencies. Please run setup first:")
@@ -47,9 +62,100 @@ except ImportError:
 # ─── Constants ───────────────────────────────────────────────────────────────
 
 PO_API_URL = "https://publicobservability.io/summary/current"
-SENT_ALERTS_FILE = ".demo_sent_alerts.json"
+SENT_ALERTS_FILE = ".demo_sent_alerts.ndjson"  # Append-only: one JSON record per line
+LEGACY_SENT_ALERTS_FILE = ".demo_sent_alerts.json"  # Pre-NDJSON format, migrated on load
+LLM_CACHE_FILE = ".demo_llm_cache.json"
+LLM_CACHE_TTL_SECONDS = 24 * 3600
+# Event fields that identify an external event for LLM cache lookups
+LLM_CACHE_EVENT_FIELDS = ("id", "title", "alert_type", "location", "start_time", "severity")
 DEFAULT_MODEL = "gpt-5-mini"
 MAX_EVENT_AGE_HOURS = 15  # Exclude events with start_time older than this
+PREFETCH_MAX_AGE_SECONDS = 300  # Discard background-fetched events older than this
+MAX_PROMPT_DESCRIPTION_CHARS = 500  # Cap on event description length sent to the LLM
+MAX_CONCURRENT_GENERATIONS = 8  # Parallel OpenAI calls when generating several alerts
+MAX_CONCURRENT_RESOLVES = 8  # Parallel BigPanda POSTs when resolving alerts
+MAX_REGENERATIONS = 2  # Times the user may regenerate a rejected alert before cancelling
+OPENAI_TIMEOUT_SECONDS = 60.0
+OPENAI_MAX_RETRIES = 2
+
+# Local files live next to this script; resolved once at import
+SCRIPT_DIR = Path(__file__).resolve().parent
+ENV_PATH = SCRIPT_DIR / ".env"
+SENT_ALERTS_PATH = SCRIPT_DIR / SENT_ALERTS_FILE
+LEGACY_SENT_ALERTS_PATH = SCRIPT_DIR / LEGACY_SENT_ALERTS_FILE
+LLM_CACHE_PATH = SCRIPT_DIR / LLM_CACHE_FILE
+
+# Event severity ranking (for sorting) and Rich styles (for display)
+SEVERITY_ORDER = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+SEVERITY_STYLES = {
+    "critical": "bold red",
+    "high": "bold yellow",
+    "medium": "yellow",
+    "low": "green",
+}
+STYLED_SEVERITIES = {sev: f"[{style}]{sev}[/{style}]" for sev, style in SEVERITY_STYLES.items()}
+# Per-type "Crit/High/Med/Low" cell, filled from a severity-count dict
+SEVERITY_BREAKDOWN_TEMPLATE = (
+    "[red]{critical}[/red]/[bold yellow]{high}[/bold yellow]/"
+    "[yellow]{medium}[/yellow]/[green]{low}[/green]"
+)
+
+# Allowed values for enum-like alert fields (mirrors OIM status_map and SYSTEM_PROMPT)
+VALID_STATUSES = frozenset({"critical", "warning", "ok", "acknowledged", "unknown"})
+VALID_ENVIRONMENTS = frozenset({"production", "staging", "development", "dr"})
+VALID_CLOUD_PROVIDERS = frozenset({"aws", "azure", "gcp", "on-prem", "hybrid"})
+VALID_BUSINESS_CRITICALITIES = frozenset({"tier 1", "tier 2", "tier 3"})
+
+# Values left over from .env.example / setup templates that mean "not configured"
+PLACEHOLDER_PREFIXES = ("your_", "sk-your", "BPUAK-your")
+
+SENT_AT_DISPLAY_FORMAT = "%Y-%m-%d %H:%M"
+
+# Row numbers in a comma-separated menu selection; anything else is ignored
+SELECTION_NUMBER_RE = re.compile(r"\d+")
+
+# Payload fields shown by preview_payload, in logical display order (key doubles as label)
+PAYLOAD_DISPLAY_FIELDS = (
+    "status",
+    "host",
+    "check",
+    "description",
+    "service",
+    "application",
+    "cluster",
+    "instance",
+    "location",
+    "environment",
+    "cloud_region",
+    "cloud_provider",
+    "cloud_account_id",
+    "assignment_group",
+    "escalation_group",
+    "business_criticality",
+    "known_dependencies",
+    "business_owner",
+    "eo_correlator",
+    "timestamp",
+)
+
+# Rich markup applied to specific payload values in preview_payload
+PAYLOAD_VALUE_STYLES = {
+    "status": lambda v: (
+        "[bold red]critical[/bold red]"
+        if v == "critical"
+        else "[bold green]ok[/bold green]"
+        if v == "ok"
+        else f"[yellow]{v}[/yellow]"
+    ),
+    "eo_correlator": lambda _: "[bold magenta]true[/bold magenta]",
+}
+
+# Rich markup for repeated send/resolve messages ("%" templates, filled per call)
+SEND_ALERT_TEMPLATE = "Sending [bold]%s[/bold] alert to BigPanda..."
+HTTP_ERROR_TEMPLATE = "[red]BigPanda returned HTTP %d[/red]"
+NETWORK_ERROR_TEMPLATE = "\n[red]Network error:[/red] %s"
+RESOLVED_ROW_TEMPLATE = "  [green]✓[/green] Resolved: %s"
+FAILED_ROW_TEMPLATE = "  [red]✗[/red] Failed:   %s [dim](%s)[/dim]"
 
 # BigPanda regional endpoints — resolved at runtime via BIGPANDA_REGION env var (US default)
 BP_INTEGRATIONS_URLS = {
@@ -130,6 +236,9 @@ OIM_CONFIG_PAYLOAD = {
     "sample_payload": json.dumps(OIM_SAMPLE_PAYLOAD),
 }
 
+# Static, so encoded once at import and posted as-is by setup_oim_integration
+OIM_CONFIG_BODY = orjson.dumps(OIM_CONFIG_PAYLOAD)
+
 
 # ─── LLM System Prompt ──────────────────────────────────────────────────────
 
@@ -267,6 +376,38 @@ EXAMPLE OUTPUT for "Slack: Trouble Accessing Slack":
 
 Respond with ONLY a valid JSON object containing ALL of the fields listed above. No additional text."""
 
+# SYSTEM_PROMPT must stay byte-identical across calls (no interpolation) so that
+# OpenAI's automatic prompt caching can reuse the prefix. The hash routes
+# requests to the same cache and keys the local LLM cache.
+SYSTEM_PROMPT_HASH = hashlib.sha256(SYSTEM_PROMPT.encode("utf-8")).hexdigest()[:16]
+
+# Structured-output schema for the generated alert. The server enforces the
+# field set and enum values, so replies carry no extra keys or prose.
+_ALERT_STRING_FIELDS = (
+    "host", "check", "description", "service", "application", "cluster", "instance",
+    "location", "cloud_region", "cloud_account_id", "assignment_group",
+    "escalation_group", "business_owner",
+)
+ALERT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        **{name: {"type": "string"} for name in _ALERT_STRING_FIELDS},
+        "environment": {"type": "string", "enum": sorted(VALID_ENVIRONMENTS)},
+        "cloud_provider": {"type": "string", "enum": sorted(VALID_CLOUD_PROVIDERS)},
+        "business_criticality": {
+            "type": "string",
+            "enum": sorted(VALID_BUSINESS_CRITICALITIES),
+        },
+        "known_dependencies": {"type": "array", "items": {"type": "string"}},
+    },
+    "additionalProperties": False,
+}
+ALERT_SCHEMA["required"] = list(ALERT_SCHEMA["properties"])
+ALERT_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "internal_alert", "schema": ALERT_SCHEMA, "strict": True},
+}
+
 
 # ─── Helpers ─────────────────────────────────────────────────────────────────
 
@@ -277,25 +418,223 @@ def truncate(text, max_len, suffix="..."):
     return (text[: max_len - len(suffix)] + suffix) if len(text) > max_len else text
 
 
+# datetime.fromisoformat() accepts a trailing "Z" natively from Python 3.11
+_ISO_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+
+def parse_iso_timestamp(value):
+    """Parse an ISO-8601 string into POSIX seconds. Returns None if unparseable.
+
+    Naive timestamps are treated as UTC.
+    """
+    if not value or not isinstance(value, str):
+        return None
+    if not _ISO_ACCEPTS_Z and value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    try:
+        dt = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def normalize_choice(value, allowed, default):
+    """Return value lower-cased if it is one of allowed, otherwise default."""
+    if isinstance(value, str):
+        value = value.strip().lower()
+        if value in allowed:
+            return value
+    return default
+
+
+def parse_selection(selection):
+    """Return the row numbers in a comma-separated selection string, in order typed."""
+    return [int(n) for n in SELECTION_NUMBER_RE.findall(selection)]
+
+
+class LLMCache:
+    """On-disk cache of raw LLM completions, keyed by model, system prompt and event.
+
+    Entries expire after ``ttl`` seconds. Cache I/O failures are never fatal —
+    a broken cache file just behaves like an empty cache.
+    """
+
+    def __init__(self, path, ttl=LLM_CACHE_TTL_SECONDS):
+        self.path = path
+        self.ttl = ttl
+        self._entries = self._load()
+
+    def _load(self):
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, "rb") as f:
+                entries = orjson.loads(f.read())
+        except (orjson.JSONDecodeError, IOError):
+            return {}
+        if not isinstance(entries, dict):
+            return {}
+        # Drop malformed entries so get/save can rely on a numeric "at" and str "content"
+        return {
+            k: v
+            for k, v in entries.items()
+            if isinstance(v, dict)
+            and type(v.get("at")) in (int, float)
+            and isinstance(v.get("content"), str)
+        }
+
+    @staticmethod
+    def key(model, event):
+        """Content-addressed key for a (model, SYSTEM_PROMPT_HASH, event) combination."""
+        fingerprint = {k: event.get(k) for k in LLM_CACHE_EVENT_FIELDS}
+        blob = orjson.dumps(
+            {"model": model, "sys": SYSTEM_PROMPT_HASH, "evt": fingerprint},
+            option=orjson.OPT_SORT_KEYS,
+        )
+        return hashlib.sha256(blob).hexdigest()
+
+    def get(self, key):
+        """Return the cached completion string for key, or None if missing/expired."""
+        entry = self._entries.get(key)
+        if entry and time.time() - entry.get("at", 0) < self.ttl:
+            return entry.get("content")
+        return None
+
+    def put(self, key, content, save=True):
+        """Store a completion string; persist immediately unless save=False.
+
+        Batch callers pass save=False for each entry and call save() once at the end.
+        """
+        self._entries[key] = {"at": time.time(), "content": content}
+        if save:
+            self.save()
+
+    def save(self):
+        """Atomically persist the cache, dropping expired entries.
+
+        Written to a temp file first and swapped in with os.replace, so a crash
+        mid-write never leaves a truncated cache file behind.
+        """
+        now = time.time()
+        self._entries = {
+            k: v for k, v in self._entries.items() if now - v.get("at", 0) < self.ttl
+        }
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(orjson.dumps(self._entries))
+            os.replace(tmp_path, self.path)
+        except IOError:
+            pass
+
+
 # ─── Main Class ──────────────────────────────────────────────────────────────
 
 
 class DemoSimulator:
     """Interactive demo simulator for Strata EO correlation demos."""
 
-    def __init__(self):
+    # (key, default, allowed values or None for free text) copied from LLM output
+    # into the BigPanda payload; status, known_dependencies, eo_correlator and
+    # timestamp are filled in separately.
+    _PAYLOAD_FIELDS = (
+        # ── Required fields ──────────────────────────────────
+        ("host", "unknown-host", None),
+        ("check", "unknown_check", None),
+        ("description", "No description", None),
+        # ── Primary properties ───────────────────────────────
+        ("service", "", None),
+        ("application", "", None),
+        ("cluster", "", None),
+        ("instance", "", None),
+        # ── Location & environment ───────────────────────────
+        ("location", "", None),
+        ("environment", "production", VALID_ENVIRONMENTS),
+        # ── Cloud context ────────────────────────────────────
+        ("cloud_region", "", None),
+        ("cloud_provider", "", VALID_CLOUD_PROVIDERS),
+        ("cloud_account_id", "", None),
+        # ── ITSM / operational context ───────────────────────
+        ("assignment_group", "", None),
+        ("escalation_group", "", None),
+        ("business_criticality", "", VALID_BUSINESS_CRITICALITIES),
+        ("business_owner", "", None),
+    )
+
+    # Payload fields kept in the local tracking file for later resolution
+    _TRACKED_FIELDS = (
+        "host", "check", "description", "service", "application", "cluster", "instance",
+        "location", "environment", "cloud_region", "cloud_provider", "cloud_account_id",
+        "assignment_group", "escalation_group", "business_criticality",
+        "known_dependencies", "business_owner",
+    )
+
+    # Fields echoed back (defaulting to "") in the OK payload that resolves an alert
+    _RESOLVE_FIELDS = (
+        "service", "application", "cluster", "instance", "location", "environment",
+    )
+
+    def __init__(self, quiet=False):
         self.console = Console()
+        self._quiet = quiet  # One-line summaries instead of payload/alert tables
         self.sent_alerts = []
+        # Views of sent_alerts split by status, kept current as alerts are sent/resolved
+        self._active_alerts = []
+        self._resolved_alerts = []
         self.events = []
+        # Shared HTTP session so repeat calls reuse pooled keep-alive connections
+        self._http = requests.Session()
+        self._http.headers["Accept"] = "application/json"
+        self._http.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=8,
+                max_retries=Retry(
+                    total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504]
+                ),
+            ),
+        )
+        # Pending background event fetch: (daemon thread, outcome dict, start time)
+        self._prefetch = None
+        self._config_missing = None  # Memoized _validate_config() result
+        self._openai = None  # Created on first use; see the openai property
+        self._openai_lock = threading.Lock()
         self._load_config()
         self._load_sent_alerts()
+        self.llm_cache = LLMCache(LLM_CACHE_PATH)
+
+    def close(self):
+        """Release pooled HTTP connections.
+
+        A still-running event prefetch is a daemon thread, so it never delays exit.
+        """
+        self._http.close()
+        if self._openai is not None:
+            self._openai.close()
+
+    @property
+    def openai(self):
+        """Shared OpenAI client, created on first use and reused for keep-alive."""
+        if self._openai is None:
+            with self._openai_lock:  # Batch generation may race here from worker threads
+                if self._openai is None:
+                    from openai import OpenAI  # Deferred: see Dependency Check
+
+                    self._openai = OpenAI(
+                        api_key=self.openai_api_key,
+                        timeout=OPENAI_TIMEOUT_SECONDS,
+                        max_retries=OPENAI_MAX_RETRIES,
+                    )
+        return self._openai
 
     # ── Configuration ────────────────────────────────────────────────────
 
     def _load_config(self):
         """Load configuration from .env file and environment."""
-        env_path = Path(__file__).parent / ".env"
-        load_dotenv(env_path)
+        load_dotenv(ENV_PATH)
 
         self.bp_org_token = os.getenv("BIGPANDA_ORG_ACCESS_TOKEN", "")
         self.bp_app_key = os.getenv("BIGPANDA_APP_KEY", "")
@@ -310,16 +649,25 @@ class DemoSimulator:
         self.bp_alerts_url = os.getenv("BIGPANDA_ALERTS_URL", f"{bp_integrations_base}/oim/api/alerts")
         self.oim_config_base_url = f"{bp_integrations_base}/configurations/alerts/oim"
 
+        # Credentials are fixed for the process, so build auth headers/params once
+        self._bp_auth_headers = {
+            "Authorization": f"Bearer {self.bp_org_token}",
+            "Content-Type": "application/json",
+        }
+        self._bp_alert_params = {
+            "access_token": self.bp_org_token,
+            "app_key": self.bp_app_key,
+        }
+
         if not self.bp_org_name and self.bp_org_token:
             self.bp_org_name = self._resolve_org_name()
 
     def _resolve_org_name(self):
         """Resolve the org name from the BigPanda API using the Org Access Token."""
         try:
-            resp = requests.get(
+            resp = self._http.get(
                 f"{self.bp_api_base}/resources/v2.0/organizations/me",
-                headers={"Authorization": f"Bearer {self.bp_org_token}",
-                         "Accept": "application/json"},
+                headers=self._bp_auth_headers,
                 timeout=10,
             )
             if resp.status_code == 200:
@@ -330,17 +678,23 @@ class DemoSimulator:
         return ""
 
     def _validate_config(self):
-        """Check all required environment variables are set. Returns list of missing var names."""
+        """Check all required environment variables are set. Returns list of missing var names.
+
+        Configuration is read once at startup, so the result is computed once and reused.
+        """
+        if self._config_missing is not None:
+            return self._config_missing
+
         missing = []
-        placeholders = ("your_", "sk-your", "BPUAK-your")
 
         for var_name, value in [
             ("BIGPANDA_ORG_ACCESS_TOKEN", self.bp_org_token),
             ("BIGPANDA_APP_KEY", self.bp_app_key),
             ("OPENAI_API_KEY", self.openai_api_key),
         ]:
-            if not value or any(value.startswith(p) for p in placeholders):
+            if not value or value.startswith(PLACEHOLDER_PREFIXES):
                 missing.append(var_name)
+        self._config_missing = missing
         return missing
 
     def _show_config_help(self, missing):
@@ -374,13 +728,12 @@ class DemoSimulator:
             self.console.print(f"\n  [yellow]●[/yellow] [bold]{var}[/bold]")
             self.console.print(f"    {help_text.get(var, '')}")
 
-        env_path = Path(__file__).parent / ".env"
         self.console.print("\n[bold]How to fix:[/bold]")
-        self.console.print(f"  1. Open [cyan]{env_path}[/cyan] in any text editor")
+        self.console.print(f"  1. Open [cyan]{ENV_PATH}[/cyan] in any text editor")
         self.console.print("  2. Replace the placeholder values with your real credentials")
         self.console.print("  3. Save and re-run: [cyan]./run.sh[/cyan]")
 
-        if not env_path.exists():
+        if not ENV_PATH.exists():
             self.console.print(
                 "\n  [yellow]Tip:[/yellow] No .env file found. Run [cyan]./setup.sh[/cyan] first "
                 "to create one from the template."
@@ -390,20 +743,107 @@ class DemoSimulator:
     # ── Sent Alert Tracking ──────────────────────────────────────────────
 
     def _load_sent_alerts(self):
-        """Load previously sent alerts from the local tracking file."""
-        alerts_path = Path(__file__).parent / SENT_ALERTS_FILE
-        if alerts_path.exists():
+        """Load previously sent alerts from the local NDJSON tracking file.
+
+        Each line is either a full alert record or a patch ({"id": ..., "status": "ok", ...})
+        that is merged into the record with the same id. When the file holds patches
+        or torn lines, it is compacted once here so it does not grow without bound.
+        """
+        if not SENT_ALERTS_PATH.exists() and LEGACY_SENT_ALERTS_PATH.exists():
+            self._migrate_legacy_sent_alerts()
+        if not SENT_ALERTS_PATH.exists():
+            return
+
+        try:
+            lines = SENT_ALERTS_PATH.read_bytes().splitlines()
+        except IOError:
+            return
+
+        by_id = {}
+        line_count = 0
+        assigned_ids = False
+        for line in lines:
+            if not line.strip():
+                continue
+            line_count += 1
             try:
-                with open(alerts_path, "r") as f:
-                    self.sent_alerts = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                self.sent_alerts = []
+                record = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                continue  # Skip a torn/partial line rather than losing the whole file
+            if not isinstance(record, dict):
+                continue  # Valid JSON but not an alert record
+            alert_id = record.get("id")
+            if isinstance(alert_id, (list, dict)):
+                continue  # Unhashable id; cannot be merged with its patches
+            if alert_id is None:
+                if record.keys() <= {"id", "status", "resolved_at"}:
+                    continue  # Orphan resolve patch; it matches no alert
+                # Give id-less alerts an id so later resolve patches can find them
+                alert_id = record["id"] = uuid.uuid4().hex
+                assigned_ids = True
+            if alert_id in by_id:
+                by_id[alert_id].update(record)
+            else:
+                by_id[alert_id] = record
+        self.sent_alerts = list(by_id.values())
+
+        # Backfill the display timestamp for records written before it was stored
+        for alert in self.sent_alerts:
+            if "sent_at_pretty" not in alert:
+                try:
+                    sent_at = datetime.fromisoformat(alert["sent_at"])
+                    alert["sent_at_pretty"] = sent_at.strftime(SENT_AT_DISPLAY_FORMAT)
+                except (KeyError, TypeError, ValueError):
+                    pass
 
-    def _save_sent_alerts(self):
-        """Persist sent alerts to the local tracking file."""
-        alerts_path = Path(__file__).parent / SENT_ALERTS_FILE
-        with open(alerts_path, "w") as f:
-            json.dump(self.sent_alerts, f, indent=2)
+        self._partition_sent_alerts()
+
+        if assigned_ids or line_count > len(self.sent_alerts):
+            try:
+                self._rewrite_sent_alerts(self.sent_alerts)
+            except IOError:
+                pass  # Compaction is best-effort; the append log is still valid
+
+    def _partition_sent_alerts(self):
+        """Rebuild the active/resolved views from sent_alerts."""
+        self._active_alerts = [a for a in self.sent_alerts if a.get("status") != "ok"]
+        self._resolved_alerts = [a for a in self.sent_alerts if a.get("status") == "ok"]
+
+    def _migrate_legacy_sent_alerts(self):
+        """Convert the old JSON-array tracking file to NDJSON, assigning record ids."""
+        try:
+            with open(LEGACY_SENT_ALERTS_PATH, "rb") as f:
+                legacy = orjson.loads(f.read())
+        except (orjson.JSONDecodeError, IOError):
+            return
+        if not isinstance(legacy, list):
+            return
+        records = [record for record in legacy if isinstance(record, dict)]
+        for record in records:
+            record.setdefault("id", uuid.uuid4().hex)
+        try:
+            self._rewrite_sent_alerts(records)
+            os.replace(LEGACY_SENT_ALERTS_PATH, f"{LEGACY_SENT_ALERTS_PATH}.migrated")
+        except OSError:
+            pass  # Leave the legacy file in place; migration is retried next start
+
+    def _rewrite_sent_alerts(self, records):
+        """Atomically replace the tracking file with one line per record.
+
+        Written to a temp file first and swapped in with os.replace, so a crash
+        mid-write never leaves a truncated tracking file behind.
+        """
+        tmp_path = SENT_ALERTS_PATH.with_name(SENT_ALERTS_PATH.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(b"".join(orjson.dumps(record) + b"\n" for record in records))
+        os.replace(tmp_path, SENT_ALERTS_PATH)
+
+    def _append_sent_records(self, records):
+        """Append alert records or patches to the tracking file (one line each)."""
+        if not records:
+            return
+        with open(SENT_ALERTS_PATH, "ab") as f:
+            f.write(b"".join(orjson.dumps(record) + b"\n" for record in records))
 
     # ── UI Components ────────────────────────────────────────────────────
 
@@ -425,7 +865,7 @@ class DemoSimulator:
 
     def _show_main_menu(self):
         """Display the main menu and return the user's choice."""
-        active_count = len([a for a in self.sent_alerts if a.get("status") != "ok"])
+        active_count = len(self._active_alerts)
 
         self.console.print()
         table = Table(box=box.SIMPLE, show_header=False, padding=(0, 2))
@@ -450,8 +890,85 @@ class DemoSimulator:
 
     # ── Event Fetching ───────────────────────────────────────────────────
 
+    def _fetch_events_raw(self):
+        """Fetch and filter active events without any UI.
+
+        Returns (active_events, total_count, skipped_future, skipped_stale).
+        Raises requests.RequestException on network/HTTP errors and
+        orjson.JSONDecodeError on a malformed response body.
+        """
+        response = self._http.get(
+            PO_API_URL,
+            params={"limit": 1000},
+            timeout=30,
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+
+        events = data.get("alerts", [])
+
+        # Filter: active only, no future start_times, no stale events
+        now_ts = time.time()
+        cutoff_ts = now_ts - MAX_EVENT_AGE_HOURS * 3600
+        active_events = []
+        skipped_future = 0
+        skipped_stale = 0
+
+        for e in events:
+            if not e.get("is_active", False):
+                continue
+
+            start_ts = parse_iso_timestamp(e.get("start_time"))
+            if start_ts is not None:  # Keep events with missing/unparseable times
+                if start_ts > now_ts:
+                    skipped_future += 1
+                    continue
+                if start_ts < cutoff_ts:
+                    skipped_stale += 1
+                    continue
+
+            active_events.append(e)
+
+        total_count = data.get("total_count", len(events))
+        return active_events, total_count, skipped_future, skipped_stale
+
+    def _prefetch_events(self):
+        """Start fetching events in the background while the user reads the menu.
+
+        Runs on a daemon thread so quitting (or Ctrl-C) never waits for the GET.
+        A pending prefetch is kept unless it has gone stale.
+        """
+        if self._prefetch_is_fresh():
+            return
+        outcome = {}
+
+        def _run():
+            try:
+                outcome["result"] = self._fetch_events_raw()
+            except Exception as e:  # Re-raised in fetch_events on the main thread
+                outcome["error"] = e
+
+        thread = threading.Thread(target=_run, name="demo-sim-prefetch", daemon=True)
+        thread.start()
+        self._prefetch = (thread, outcome, time.monotonic())
+
+    def _prefetch_is_fresh(self):
+        """True if a prefetch is pending and younger than PREFETCH_MAX_AGE_SECONDS."""
+        return (
+            self._prefetch is not None
+            and time.monotonic() - self._prefetch[2] <= PREFETCH_MAX_AGE_SECONDS
+        )
+
     def fetch_events(self):
-        """Fetch current active events from publicobservability.io."""
+        """Fetch current active events from publicobservability.io.
+
+        Reuses a pending background prefetch when it is recent enough, so the
+        network round trip overlaps with the user's menu selection.
+        """
+        # A stale prefetch is dropped; its daemon thread just finishes on its own
+        prefetch = self._prefetch if self._prefetch_is_fresh() else None
+        self._prefetch = None
+
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -463,44 +980,15 @@ class DemoSimulator:
             )
 
             try:
-                response = requests.get(
-                    PO_API_URL,
-                    headers={"Accept": "application/json"},
-                    params={"limit": 1000},
-                    timeout=30,
-                )
-                response.raise_for_status()
-                data = response.json()
-
-                events = data.get("alerts", [])
-
-                # Filter: active only, no future start_times, no stale events
-                now = datetime.now(timezone.utc)
-                cutoff = now - timedelta(hours=MAX_EVENT_AGE_HOURS)
-                active_events = []
-                skipped_future = 0
-                skipped_stale = 0
-
-                for e in events:
-                    if not e.get("is_active", False):
-                        continue
-
-                    start_str = e.get("start_time")
-                    if start_str:
-                        try:
-                            start_dt = datetime.fromisoformat(
-                                start_str.replace("Z", "+00:00")
-                            )
-                            if start_dt > now:
-                                skipped_future += 1
-                                continue
-                            if start_dt < cutoff:
-                                skipped_stale += 1
-                                continue
-                        except (ValueError, TypeError):
-                            pass  # Keep events with unparseable times
-
-                    active_events.append(e)
+                if prefetch is not None:
+                    thread, outcome, _ = prefetch
+                    thread.join()
+                    if "error" in outcome:
+                        raise outcome["error"]
+                    result = outcome["result"]
+                else:
+                    result = self._fetch_events_raw()
+                active_events, total_count, skipped_future, skipped_stale = result
 
                 self.events = active_events
 
@@ -515,13 +1003,13 @@ class DemoSimulator:
                     task,
                     description=(
                         f"[green]Fetched {len(active_events)} active events "
-                        f"(of {data.get('total_count', len(events))} total)"
+                        f"(of {total_count} total)"
                         f"{filter_note}[/green]"
                     ),
                 )
                 return active_events
 
-            except requests.RequestException as e:
+            except (requests.RequestException, orjson.JSONDecodeError) as e:
                 progress.update(task, description="[red]Failed to fetch events[/red]")
                 self.console.print(f"\n[red]Error fetching events:[/red] {e}")
                 return []
@@ -530,15 +1018,19 @@ class DemoSimulator:
 
     def display_type_summary(self, events):
         """Display a summary table of event types with counts. Returns {number: type_name} map."""
+        # Single pass: counts, severity breakdown and first example per type
         type_counts = {}
         type_severities = {}
+        type_examples = {}
         for event in events:
             atype = event.get("alert_type", "unknown")
             type_counts[atype] = type_counts.get(atype, 0) + 1
             sev = event.get("severity", "low")
-            if atype not in type_severities:
-                type_severities[atype] = {"critical": 0, "high": 0, "medium": 0, "low": 0}
-            type_severities[atype][sev] = type_severities[atype].get(sev, 0) + 1
+            sevs = type_severities.get(atype)
+            if sevs is None:
+                sevs = type_severities[atype] = {"critical": 0, "high": 0, "medium": 0, "low": 0}
+                type_examples[atype] = event
+            sevs[sev] = sevs.get(sev, 0) + 1
 
         table = Table(
             title="Available Event Types",
@@ -556,17 +1048,9 @@ class DemoSimulator:
         type_map = {}
 
         for i, (atype, count) in enumerate(sorted_types, 1):
-            example = next((e for e in events if e.get("alert_type") == atype), None)
+            example = type_examples.get(atype)
             example_title = truncate(example.get("title", ""), 43) if example else ""
-
-            sevs = type_severities.get(atype, {})
-            sev_str = (
-                f"[red]{sevs.get('critical', 0)}[/red]/"
-                f"[bold yellow]{sevs.get('high', 0)}[/bold yellow]/"
-                f"[yellow]{sevs.get('medium', 0)}[/yellow]/"
-                f"[green]{sevs.get('low', 0)}[/green]"
-            )
-
+            sev_str = SEVERITY_BREAKDOWN_TEMPLATE.format_map(type_severities[atype])
             table.add_row(str(i), atype, str(count), sev_str, example_title)
             type_map[i] = atype
 
@@ -585,17 +1069,17 @@ class DemoSimulator:
         if selection.strip().lower() == "all":
             return list(type_map.values())
 
-        try:
-            indices = [int(x.strip()) for x in selection.split(",")]
-            selected = [type_map[i] for i in indices if i in type_map]
-            if not selected:
-                self.console.print("[yellow]No valid types selected, showing all.[/yellow]")
-                return list(type_map.values())
-            return selected
-        except ValueError:
+        indices = parse_selection(selection)
+        if not indices:
             self.console.print("[yellow]Invalid input, showing all types.[/yellow]")
             return list(type_map.values())
 
+        selected = [type_map[i] for i in indices if i in type_map]
+        if not selected:
+            self.console.print("[yellow]No valid types selected, showing all.[/yellow]")
+            return list(type_map.values())
+        return selected
+
     def display_events(self, events, selected_types):
         """Display events filtered by selected types. Returns (filtered_list, {number: event} map)."""
         filtered = [e for e in events if e.get("alert_type") in selected_types]
@@ -604,15 +1088,9 @@ class DemoSimulator:
             self.console.print("[yellow]No events found for the selected types.[/yellow]")
             return [], {}
 
-        severity_order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
-
         def _event_sort_key(e):
-            sev = severity_order.get(e.get("severity", "low"), 3)
-            s = e.get("start_time", "")
-            try:
-                ts = datetime.fromisoformat(s.replace("Z", "+00:00")).timestamp()
-            except (ValueError, TypeError, AttributeError):
-                ts = 0
+            sev = SEVERITY_ORDER.get(e.get("severity", "low"), 3)
+            ts = parse_iso_timestamp(e.get("start_time")) or 0
             return (sev, -ts)
 
         filtered.sort(key=_event_sort_key)
@@ -633,16 +1111,10 @@ class DemoSimulator:
 
         display_limit = 40
         event_map = {}
-        now = datetime.now(timezone.utc)
+        now_ts = time.time()
 
         for i, event in enumerate(filtered[:display_limit], 1):
             severity = event.get("severity", "unknown")
-            sev_style = {
-                "critical": "bold red",
-                "high": "bold yellow",
-                "medium": "yellow",
-                "low": "green",
-            }.get(severity, "dim")
 
             location = event.get("location", {}).get("description", "N/A")
             title = event.get("title", "N/A")
@@ -650,23 +1122,22 @@ class DemoSimulator:
             ago_str = ""
             start_time = event.get("start_time", "")
             if start_time:
-                try:
-                    st = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
-                    delta = now - st
-                    total_min = int(delta.total_seconds() // 60)
+                start_ts = parse_iso_timestamp(start_time)
+                if start_ts is None:
+                    ago_str = "?"
+                else:
+                    total_min = int((now_ts - start_ts) // 60)
                     if total_min < 60:
                         ago_str = f"{total_min}m ago"
                     elif total_min < 1440:
                         ago_str = f"{total_min // 60}h {total_min % 60}m ago"
                     else:
                         ago_str = f"{total_min // 1440}d {(total_min % 1440) // 60}h ago"
-                except (ValueError, TypeError):
-                    ago_str = "?"
 
             table.add_row(
                 str(i),
                 event.get("alert_type", "?"),
-                f"[{sev_style}]{severity}[/{sev_style}]",
+                STYLED_SEVERITIES.get(severity) or f"[dim]{severity}[/dim]",
                 f"[dim]{ago_str}[/dim]",
                 truncate(title, 48),
                 truncate(location, 28),
@@ -684,17 +1155,25 @@ class DemoSimulator:
 
         return filtered, event_map
 
-    def select_event(self, event_map):
-        """Prompt user to select one event by number."""
+    def select_events(self, event_map):
+        """Prompt user to select one or more events by number. Returns a list of events."""
         self.console.print()
-        try:
-            selection = IntPrompt.ask("Select event # to base the internal alert on")
-            if selection in event_map:
-                return event_map[selection]
+        selection = Prompt.ask(
+            "Select event # to base the internal alert on "
+            "[dim](comma-separated for several)[/dim]"
+        )
+        indices = parse_selection(selection)
+        if not indices:
             self.console.print(f"[yellow]Invalid selection: {selection}[/yellow]")
-            return None
-        except Exception:
-            return None
+            return []
+
+        invalid = [i for i in indices if i not in event_map]
+        if invalid:
+            self.console.print(
+                f"[yellow]Invalid selection: {', '.join(map(str, invalid))}[/yellow]"
+            )
+        # Preserve the user's order, drop duplicates
+        return [event_map[i] for i in dict.fromkeys(indices) if i in event_map]
 
     def show_event_detail(self, event):
         """Display detailed view of a selected event."""
@@ -716,28 +1195,17 @@ class DemoSimulator:
 
     # ── Alert Generation (LLM) ───────────────────────────────────────────
 
-    def generate_internal_alert(self, event):
-        """Use OpenAI to generate a realistic internal alert payload aligned with the event."""
-        client = OpenAI(api_key=self.openai_api_key)
+    def generate_internal_alert(self, event, refresh=False):
+        """Use OpenAI to generate a realistic internal alert payload aligned with the event.
 
-        location_desc = event.get("location", {}).get("description", "Unknown location")
-        affected = event.get("affected_count")
-        affected_str = f"{affected:,}" if affected else "N/A"
-
-        user_prompt = (
-            f"Generate a realistic internal monitoring alert based on this external event:\n\n"
-            f"Type: {event.get('alert_type', 'unknown')}\n"
-            f"Title: {event.get('title', 'N/A')}\n"
-            f"Description: {event.get('description', 'N/A')}\n"
-            f"Severity: {event.get('severity', 'unknown')}\n"
-            f"Location: {location_desc}\n"
-            f"Start Time: {event.get('start_time', 'N/A')}\n"
-            f"Source: {event.get('source_system', 'N/A')}\n"
-            f"Affected Count: {affected_str}\n\n"
-            f"Remember: Generate INTERNAL monitoring symptoms that would plausibly result "
-            f"from this external event. Do NOT mention the external event directly. "
-            f"Include ALL fields from the schema."
-        )
+        Completions are cached per event; pass refresh=True to bypass the cache
+        (e.g. when the user asks to regenerate).
+        """
+        cache_key = LLMCache.key(self.openai_model, event)
+        cached = None if refresh else self._cached_alert(cache_key)
+        if cached is not None:
+            self.console.print("[dim]Using cached AI alert for this event.[/dim]")
+            return cached
 
         with Progress(
             SpinnerColumn(),
@@ -747,28 +1215,25 @@ class DemoSimulator:
         ) as progress:
             task = progress.add_task("Generating internal alert with AI...", total=None)
 
+            content = None
             try:
-                response = client.chat.completions.create(
-                    model=self.openai_model,
-                    messages=[
-                        {"role": "system", "content": SYSTEM_PROMPT},
-                        {"role": "user", "content": user_prompt},
-                    ],
-                    response_format={"type": "json_object"},
-                    max_completion_tokens=2000,
+                content, cached_tokens = self._request_alert_content(
+                    event, deterministic=not refresh
                 )
-
-                result = json.loads(response.choices[0].message.content)
+                result = orjson.loads(content)
+                self.llm_cache.put(cache_key, content)
                 progress.update(
                     task, description="[green]Alert generated successfully[/green]"
                 )
+                if cached_tokens:
+                    self.console.print(f"[dim]Prompt cache hit: {cached_tokens} tokens[/dim]")
                 return result
 
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 progress.update(
                     task, description="[red]Failed to parse AI response[/red]"
                 )
-                raw = getattr(response.choices[0].message, "content", None) or ""
+                raw = content or ""
                 if not raw.strip():
                     self.console.print(
                         "\n[red]AI returned an empty response.[/red] "
@@ -783,51 +1248,178 @@ class DemoSimulator:
                 self.console.print(f"\n[red]Error generating alert:[/red] {e}")
                 return None
 
+    def generate_internal_alerts_batch(self, events):
+        """Generate alerts for several events concurrently.
+
+        Returns a list aligned with events; entries are None where generation failed.
+        Cached events are served without a network call.
+        """
+        results = [None] * len(events)
+        pending = []
+        for i, event in enumerate(events):
+            cache_key = LLMCache.key(self.openai_model, event)
+            cached = self._cached_alert(cache_key)
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.append((i, cache_key, event))
+
+        if not pending:
+            return results
+
+        failures = []
+        cached_tokens_total = 0
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            MofNCompleteColumn(),
+            console=self.console,
+            transient=True,
+        ) as progress:
+            task = progress.add_task(
+                "Generating internal alerts with AI...", total=len(pending)
+            )
+            workers = min(MAX_CONCURRENT_GENERATIONS, len(pending))
+            # Not a with-block: its exit waits for every queued request, so Ctrl-C
+            # would keep spending tokens until the whole batch had run.
+            executor = ThreadPoolExecutor(max_workers=workers)
+            try:
+                futures = {
+                    executor.submit(self._request_alert_content, event): (i, cache_key)
+                    for i, cache_key, event in pending
+                }
+                for future in as_completed(futures):
+                    i, cache_key = futures[future]
+                    try:
+                        content, cached_tokens = future.result()
+                        cached_tokens_total += cached_tokens
+                        results[i] = orjson.loads(content)
+                        self.llm_cache.put(cache_key, content, save=False)
+                    except Exception as e:
+                        failures.append((events[i], e))
+                    progress.update(task, advance=1)
+            except BaseException:
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+            executor.shutdown()
+
+        self.llm_cache.save()  # One cache write for the whole batch
+        for event, e in failures:
+            self.console.print(
+                f"[red]Error generating alert for[/red] "
+                f"{truncate(event.get('title', 'N/A'), 60)}: {e}"
+            )
+        if cached_tokens_total:
+            self.console.print(f"[dim]Prompt cache hit: {cached_tokens_total} tokens[/dim]")
+        return results
+
+    def _cached_alert(self, cache_key):
+        """Return the parsed cached alert for cache_key, or None."""
+        cached = self.llm_cache.get(cache_key)
+        if cached is None:
+            return None
+        try:
+            return orjson.loads(cached)
+        except orjson.JSONDecodeError:
+            return None  # Corrupt entry — treat as a miss
+
+    @staticmethod
+    def _build_user_prompt(event):
+        """Build the per-event user message. Long descriptions are truncated."""
+        location_desc = event.get("location", {}).get("description", "Unknown location")
+        affected = event.get("affected_count")
+        affected_str = f"{affected:,}" if affected else "N/A"
+        description = truncate(event.get("description"), MAX_PROMPT_DESCRIPTION_CHARS)
+
+        return (
+            f"Generate a realistic internal monitoring alert based on this external event:\n\n"
+            f"Type: {event.get('alert_type', 'unknown')}\n"
+            f"Title: {event.get('title', 'N/A')}\n"
+            f"Description: {description}\n"
+            f"Severity: {event.get('severity', 'unknown')}\n"
+            f"Location: {location_desc}\n"
+            f"Start Time: {event.get('start_time', 'N/A')}\n"
+            f"Source: {event.get('source_system', 'N/A')}\n"
+            f"Affected Count: {affected_str}\n\n"
+            f"Remember: Generate INTERNAL monitoring symptoms that would plausibly result "
+            f"from this external event. Do NOT mention the external event directly. "
+            f"Include ALL fields from the schema."
+        )
+
+    def _request_alert_content(self, event, deterministic=True):
+        """Ask OpenAI for an internal alert for event.
+
+        With deterministic=True the request is seeded from the event id, so repeat
+        generations for the same event are reproducible; regenerate passes False.
+        Returns (raw JSON reply string, prompt tokens served from OpenAI's prompt cache).
+        No UI and no caching, so it is safe to call from worker threads.
+        """
+        client = self.openai
+        user_prompt = self._build_user_prompt(event)
+
+        extra = {}
+        if deterministic:
+            event_id = str(event.get("id") or event.get("title", ""))
+            digest = hashlib.blake2b(event_id.encode("utf-8"), digest_size=4).digest()
+            extra["seed"] = int.from_bytes(digest, "big")
+
+        response = client.chat.completions.create(
+            model=self.openai_model,
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": user_prompt},
+            ],
+            response_format=ALERT_RESPONSE_FORMAT,
+            max_completion_tokens=2000,
+            extra_body={"prompt_cache_key": f"demo-sim-{SYSTEM_PROMPT_HASH}"},
+            **extra,
+        )
+        details = getattr(response.usage, "prompt_tokens_details", None)
+        cached_tokens = getattr(details, "cached_tokens", None) or 0
+        return response.choices[0].message.content, cached_tokens
+
     # ── BigPanda Payload Assembly ────────────────────────────────────────
 
-    def build_bigpanda_payload(self, generated_alert, status="critical"):
+    def build_bigpanda_payload(self, generated_alert, status="critical", timestamp=None):
         """Assemble the full BigPanda OIM alert payload from LLM output.
 
         The payload body contains the alert content.  Authentication (Bearer token)
         and routing (app_key) are handled via headers/query params at send time.
+        Batch callers may pass a shared epoch-seconds timestamp; defaults to now.
         """
         # Ensure known_dependencies is a list
         deps = generated_alert.get("known_dependencies", [])
-        if isinstance(deps, str):
-            deps = [deps]
+        deps = deps if isinstance(deps, list) else [deps] if isinstance(deps, str) else []
 
-        return {
-            # ── Required fields ──────────────────────────────────
-            "status": status,
-            "host": generated_alert.get("host", "unknown-host"),
-            "check": generated_alert.get("check", "unknown_check"),
-            "description": generated_alert.get("description", "No description"),
-            # ── Primary properties ───────────────────────────────
-            "service": generated_alert.get("service", ""),
-            "application": generated_alert.get("application", ""),
-            "cluster": generated_alert.get("cluster", ""),
-            "instance": generated_alert.get("instance", ""),
-            # ── Location & environment ───────────────────────────
-            "location": generated_alert.get("location", ""),
-            "environment": generated_alert.get("environment", "production"),
-            # ── Cloud context ────────────────────────────────────
-            "cloud_region": generated_alert.get("cloud_region", ""),
-            "cloud_provider": generated_alert.get("cloud_provider", ""),
-            "cloud_account_id": generated_alert.get("cloud_account_id", ""),
-            # ── ITSM / operational context ───────────────────────
-            "assignment_group": generated_alert.get("assignment_group", ""),
-            "escalation_group": generated_alert.get("escalation_group", ""),
-            "business_criticality": generated_alert.get("business_criticality", ""),
-            "known_dependencies": deps,
-            "business_owner": generated_alert.get("business_owner", ""),
-            # ── Correlation trigger ──────────────────────────────
-            "eo_correlator": "true",
-            # ── Timestamp (epoch seconds) ────────────────────────
-            "timestamp": int(time.time()),
-        }
+        payload = {"status": normalize_choice(status, VALID_STATUSES, "critical")}
+        for key, default, allowed in self._PAYLOAD_FIELDS:
+            if allowed is None:
+                payload[key] = generated_alert.get(key, default)
+            else:
+                payload[key] = normalize_choice(generated_alert.get(key), allowed, default)
+        payload["known_dependencies"] = deps
+        # ── Correlation trigger ──────────────────────────────
+        payload["eo_correlator"] = "true"
+        # ── Timestamp (epoch seconds) ────────────────────────
+        payload["timestamp"] = int(time.time()) if timestamp is None else timestamp
+        return payload
+
+    def _summaries_only(self):
+        """True when view-only tables should collapse to one-line summaries."""
+        return self._quiet or not self.console.is_terminal
 
     def preview_payload(self, payload, event=None):
-        """Display a formatted preview of the payload before sending."""
+        """Display a formatted preview of the payload before sending.
+
+        In quiet mode, or when output is not a terminal, prints a one-line summary instead.
+        """
+        if self._summaries_only():
+            self.console.print(
+                f"[dim]Payload:[/dim] status={payload.get('status')} "
+                f"host={payload.get('host')} check={payload.get('check')}"
+            )
+            return
+
         table = Table(
             title="BigPanda OIM Alert Payload",
             box=box.HEAVY,
@@ -837,56 +1429,21 @@ class DemoSimulator:
         table.add_column("Field", style="bold", width=24)
         table.add_column("Value", max_width=68)
 
-        # Fields in logical display order
-        display_fields = [
-            ("status", "status"),
-            ("host", "host"),
-            ("check", "check"),
-            ("description", "description"),
-            ("service", "service"),
-            ("application", "application"),
-            ("cluster", "cluster"),
-            ("instance", "instance"),
-            ("location", "location"),
-            ("environment", "environment"),
-            ("cloud_region", "cloud_region"),
-            ("cloud_provider", "cloud_provider"),
-            ("cloud_account_id", "cloud_account_id"),
-            ("assignment_group", "assignment_group"),
-            ("escalation_group", "escalation_group"),
-            ("business_criticality", "business_criticality"),
-            ("known_dependencies", "known_dependencies"),
-            ("business_owner", "business_owner"),
-            ("eo_correlator", "eo_correlator"),
-            ("timestamp", "timestamp"),
-        ]
-
-        style_map = {
-            "status": lambda v: (
-                "[bold red]critical[/bold red]"
-                if v == "critical"
-                else "[bold green]ok[/bold green]"
-                if v == "ok"
-                else f"[yellow]{v}[/yellow]"
-            ),
-            "eo_correlator": lambda _: "[bold magenta]true[/bold magenta]",
-        }
-
-        for label, key in display_fields:
+        for key in PAYLOAD_DISPLAY_FIELDS:
             value = payload.get(key)
             if value is None or value == "":
                 continue
 
-            if isinstance(value, list):
-                display_value = ", ".join(str(v) for v in value)
+            if type(value) is list:
+                display_value = ", ".join(map(str, value))
             else:
                 display_value = str(value)
 
-            formatter = style_map.get(key)
+            formatter = PAYLOAD_VALUE_STYLES.get(key)
             if formatter:
                 display_value = formatter(display_value)
 
-            table.add_row(label, display_value)
+            table.add_row(key, display_value)
 
         self.console.print()
         self.console.print(table)
@@ -900,19 +1457,34 @@ class DemoSimulator:
     # ── BigPanda Communication ───────────────────────────────────────────
 
     def _bp_headers(self):
-        """Standard BigPanda auth headers."""
-        return {
-            "Authorization": f"Bearer {self.bp_org_token}",
-            "Content-Type": "application/json",
-        }
+        """Standard BigPanda auth headers (shared dict — do not mutate)."""
+        return self._bp_auth_headers
 
-    def send_to_bigpanda(self, payload):
-        """Send an alert payload to the BigPanda OIM alerts endpoint.
+    def _send_to_bigpanda_raw(self, payload):
+        """POST one alert payload to the BigPanda OIM alerts endpoint, without any UI.
 
         Auth: Authorization Bearer header + access_token query param.
         Routing: app_key as query parameter.
-        Body: alert payload JSON.
+        Body: alert payload JSON (encoded with orjson).
+
+        Safe to call from worker threads. Returns (ok, status_code, text); on a
+        network error status_code is None and text holds the exception message.
         """
+        try:
+            response = self._http.post(
+                self.bp_alerts_url,
+                headers=self._bp_headers(),
+                params=self._bp_alert_params,
+                # Pre-encoded bytes; Content-Type comes from _bp_headers()
+                data=orjson.dumps(payload),
+                timeout=15,
+            )
+        except requests.RequestException as e:
+            return False, None, str(e)
+        return response.status_code in (200, 201, 202), response.status_code, response.text
+
+    def send_to_bigpanda(self, payload):
+        """Send an alert payload to BigPanda with a spinner. Returns True on success."""
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -920,82 +1492,60 @@ class DemoSimulator:
             transient=True,
         ) as progress:
             status_label = payload.get("status", "unknown")
-            task = progress.add_task(
-                f"Sending [bold]{status_label}[/bold] alert to BigPanda...",
-                total=None,
-            )
-
-            try:
-                response = requests.post(
-                    self.bp_alerts_url,
-                    headers=self._bp_headers(),
-                    params={
-                        "access_token": self.bp_org_token,
-                        "app_key": self.bp_app_key,
-                    },
-                    json=payload,
-                    timeout=15,
-                )
+            task = progress.add_task(SEND_ALERT_TEMPLATE % status_label, total=None)
 
-                if response.status_code in (200, 201, 202):
-                    progress.update(
-                        task,
-                        description="[bold green]Alert sent successfully![/bold green]",
-                    )
-                    return True
-                else:
-                    progress.update(
-                        task,
-                        description=f"[red]BigPanda returned HTTP {response.status_code}[/red]",
-                    )
-                    self.console.print(f"[red]Response body:[/red] {response.text[:500]}")
-                    return False
+            ok, status_code, text = self._send_to_bigpanda_raw(payload)
 
-            except requests.RequestException as e:
+            if ok:
+                progress.update(
+                    task,
+                    description="[bold green]Alert sent successfully![/bold green]",
+                )
+                return True
+            elif status_code is None:
                 progress.update(task, description="[red]Failed to send alert[/red]")
-                self.console.print(f"\n[red]Network error:[/red] {e}")
+                self.console.print(NETWORK_ERROR_TEMPLATE % text)
+                return False
+            else:
+                progress.update(task, description=HTTP_ERROR_TEMPLATE % status_code)
+                self.console.print(f"[red]Response body:[/red] {text[:500]}")
                 return False
 
     # ── Alert Tracking ───────────────────────────────────────────────────
 
     def track_sent_alert(self, payload, event):
         """Record a sent alert locally for later resolution."""
-        record = {
-            "host": payload.get("host"),
-            "check": payload.get("check"),
-            "description": payload.get("description"),
-            "service": payload.get("service"),
-            "application": payload.get("application"),
-            "cluster": payload.get("cluster"),
-            "instance": payload.get("instance"),
-            "location": payload.get("location"),
-            "environment": payload.get("environment"),
-            "cloud_region": payload.get("cloud_region"),
-            "cloud_provider": payload.get("cloud_provider"),
-            "cloud_account_id": payload.get("cloud_account_id"),
-            "assignment_group": payload.get("assignment_group"),
-            "escalation_group": payload.get("escalation_group"),
-            "business_criticality": payload.get("business_criticality"),
-            "known_dependencies": payload.get("known_dependencies"),
-            "business_owner": payload.get("business_owner"),
-            "sent_at": datetime.now(timezone.utc).isoformat(),
-            "based_on_event": event.get("title", "N/A") if event else "N/A",
-            "status": "critical",
-        }
+        record = {"id": uuid.uuid4().hex}
+        record.update({key: payload.get(key) for key in self._TRACKED_FIELDS})
+        now = datetime.now(timezone.utc)
+        record["sent_at"] = now.isoformat()
+        record["sent_at_pretty"] = now.strftime(SENT_AT_DISPLAY_FORMAT)
+        record["based_on_event"] = event.get("title", "N/A") if event else "N/A"
+        record["status"] = "critical"
         self.sent_alerts.append(record)
-        self._save_sent_alerts()
+        self._active_alerts.append(record)
+        self._append_sent_records([record])
 
     # ── Resolve Flow ─────────────────────────────────────────────────────
 
-    def show_sent_alerts(self):
-        """Display all tracked sent alerts in a table. Returns {number: alert} map of active ones."""
-        active = [a for a in self.sent_alerts if a.get("status") != "ok"]
-        resolved = [a for a in self.sent_alerts if a.get("status") == "ok"]
+    def show_sent_alerts(self, compact=False):
+        """Display all tracked sent alerts in a table. Returns {number: alert} map of active ones.
+
+        With compact=True only the active/resolved counts are printed (no table).
+        """
+        active = self._active_alerts
+        resolved = self._resolved_alerts
 
         if not self.sent_alerts:
             self.console.print("\n[yellow]No sent alerts on record.[/yellow]")
             return {}
 
+        if compact:
+            self.console.print(
+                f"\n[dim]{len(active)} active, {len(resolved)} resolved alert(s) on file.[/dim]"
+            )
+            return dict(enumerate(active, 1))
+
         if active:
             table = Table(
                 title=f"Active Alerts ({len(active)})",
@@ -1012,13 +1562,7 @@ class DemoSimulator:
 
             alert_map = {}
             for i, alert in enumerate(active, 1):
-                sent_at = alert.get("sent_at", "N/A")
-                if sent_at != "N/A":
-                    try:
-                        dt = datetime.fromisoformat(sent_at)
-                        sent_at = dt.strftime("%Y-%m-%d %H:%M")
-                    except ValueError:
-                        pass
+                sent_at = alert.get("sent_at_pretty") or alert.get("sent_at", "N/A")
 
                 table.add_row(
                     str(i),
@@ -1045,7 +1589,8 @@ class DemoSimulator:
 
     def resolve_alerts(self, auto_all=False):
         """Send OK status for previously sent alerts. If auto_all=True, resolve without prompting."""
-        alert_map = self.show_sent_alerts()
+        # --resolve-all needs no numbered table since nothing is selected by hand
+        alert_map = self.show_sent_alerts(compact=auto_all and self._summaries_only())
         if not alert_map:
             return
 
@@ -1061,12 +1606,12 @@ class DemoSimulator:
             if selection.strip().lower() == "all":
                 to_resolve = list(alert_map.values())
             else:
-                try:
-                    indices = [int(x.strip()) for x in selection.split(",")]
-                    to_resolve = [alert_map[i] for i in indices if i in alert_map]
-                except ValueError:
+                indices = parse_selection(selection)
+                if not indices:
                     self.console.print("[yellow]Invalid input.[/yellow]")
                     return
+                # Drop repeats so an alert is never POSTed or recorded twice
+                to_resolve = [alert_map[i] for i in dict.fromkeys(indices) if i in alert_map]
 
         if not to_resolve:
             self.console.print("[yellow]No alerts selected.[/yellow]")
@@ -1081,39 +1626,96 @@ class DemoSimulator:
 
         self.console.print()
         success_count = 0
-        for alert in to_resolve:
-            # Build OK payload — must include the same primary + secondary property
-            # values so BigPanda can match and resolve the original alert.
-            ok_payload = {
-                "status": "ok",
-                "host": alert.get("host"),
-                "check": alert.get("check"),
-                "description": f"Resolved: {alert.get('description', 'Alert cleared')}",
-                "service": alert.get("service", ""),
-                "application": alert.get("application", ""),
-                "cluster": alert.get("cluster", ""),
-                "instance": alert.get("instance", ""),
-                "location": alert.get("location", ""),
-                "environment": alert.get("environment", ""),
-                "eo_correlator": "true",
-                "timestamp": int(time.time()),
-            }
-
-            success = self.send_to_bigpanda(ok_payload)
-            host_short = truncate(alert.get("host", "?"), 40)
-            if success:
-                alert["status"] = "ok"
-                alert["resolved_at"] = datetime.now(timezone.utc).isoformat()
-                self.console.print(f"  [green]✓[/green] Resolved: {host_short}")
-                success_count += 1
-            else:
-                self.console.print(f"  [red]✗[/red] Failed:   {host_short}")
-
-        self._save_sent_alerts()
+        patches = []
+        # Sends run concurrently; results come back in order and are printed
+        # from this thread only, so console output never interleaves. One
+        # progress bar covers the whole batch.
+        workers = min(MAX_CONCURRENT_RESOLVES, len(to_resolve))
+        # One timestamp for the whole batch; BigPanda does not need them unique
+        resolve_one = functools.partial(self._resolve_one, timestamp=int(time.time()))
+        # Not a with-block: its exit waits for every queued send, so Ctrl-C would
+        # keep sending OK statuses until the whole batch had gone out.
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                MofNCompleteColumn(),
+                console=self.console,
+                transient=True,
+            ) as progress:
+                task = progress.add_task(
+                    "Sending [bold green]OK[/bold green] status to BigPanda...",
+                    total=len(to_resolve),
+                )
+                for alert, success, detail in executor.map(resolve_one, to_resolve):
+                    progress.update(task, advance=1)
+                    host_short = truncate(alert.get("host", "?"), 40)
+                    if success:
+                        patch = {
+                            "id": alert.get("id"),
+                            "status": "ok",
+                            "resolved_at": datetime.now(timezone.utc).isoformat(),
+                        }
+                        alert.update(patch)
+                        patches.append(patch)
+                        self.console.print(RESOLVED_ROW_TEMPLATE % host_short)
+                        success_count += 1
+                    else:
+                        self.console.print(FAILED_ROW_TEMPLATE % (host_short, detail))
+        except BaseException:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        else:
+            executor.shutdown()
+        finally:
+            # Record whatever was resolved, even if the batch was interrupted
+            if patches:
+                # One pass to drop the newly resolved alerts from the active view
+                self._active_alerts = [
+                    a for a in self._active_alerts if a.get("status") != "ok"
+                ]
+                self._resolved_alerts.extend(
+                    a for a in to_resolve if a.get("status") == "ok"
+                )
+            self._append_sent_records(patches)
         self.console.print(
             f"\n[bold]{success_count}/{len(to_resolve)} alerts resolved.[/bold]"
         )
 
+    def _ok_payload_for(self, alert, timestamp=None):
+        """Build the OK (resolve) payload for a tracked alert.
+
+        Must include the same primary + secondary property values so BigPanda
+        can match and resolve the original alert.
+        """
+        ok_payload = {
+            "status": "ok",
+            "host": alert.get("host"),
+            "check": alert.get("check"),
+            "description": f"Resolved: {alert.get('description', 'Alert cleared')}",
+        }
+        ok_payload.update({key: alert.get(key, "") for key in self._RESOLVE_FIELDS})
+        ok_payload["eo_correlator"] = "true"
+        ok_payload["timestamp"] = int(time.time()) if timestamp is None else timestamp
+        return ok_payload
+
+    def _resolve_one(self, alert, timestamp=None):
+        """Send the OK status for one tracked alert, without any UI.
+
+        Safe to call from worker threads. Returns (alert, success, error_detail).
+        """
+        # One alert per POST: the OIM config installed by setup_oim_integration
+        # sets is_array=False, so the endpoint will not accept a bulk array body.
+        ok, status_code, text = self._send_to_bigpanda_raw(
+            self._ok_payload_for(alert, timestamp)
+        )
+        if ok:
+            return alert, True, ""
+        if status_code is None:
+            return alert, False, f"network error: {text}"
+        return alert, False, f"HTTP {status_code}"
+
     # ── OIM Integration Setup ────────────────────────────────────────────
 
     def setup_oim_integration(self):
@@ -1147,10 +1749,10 @@ class DemoSimulator:
             )
 
             try:
-                response = requests.post(
+                response = self._http.post(
                     config_url,
                     headers=self._bp_headers(),
-                    json=OIM_CONFIG_PAYLOAD,
+                    data=OIM_CONFIG_BODY,
                     timeout=20,
                 )
 
@@ -1164,8 +1766,7 @@ class DemoSimulator:
                     )
                 else:
                     progress.update(
-                        task,
-                        description=f"[red]BigPanda returned HTTP {response.status_code}[/red]",
+                        task, description=HTTP_ERROR_TEMPLATE % response.status_code
                     )
                     self.console.print(f"[red]Response:[/red] {response.text[:500]}")
                     if response.status_code == 401:
@@ -1181,7 +1782,7 @@ class DemoSimulator:
 
             except requests.RequestException as e:
                 progress.update(task, description="[red]Failed to configure[/red]")
-                self.console.print(f"\n[red]Network error:[/red] {e}")
+                self.console.print(NETWORK_ERROR_TEMPLATE % e)
 
     # ── Generate & Send Flow ─────────────────────────────────────────────
 
@@ -1203,39 +1804,29 @@ class DemoSimulator:
         if not event_map:
             return
 
-        # Select one event
-        event = self.select_event(event_map)
-        if not event:
+        # Select one or more events
+        selected = self.select_events(event_map)
+        if not selected:
             self.console.print("[yellow]No event selected.[/yellow]")
             return
+        if len(selected) > 1:
+            self._generate_and_send_batch(selected)
+            return
+        event = selected[0]
 
         # Show event detail
         self.show_event_detail(event)
 
-        # Generate the internal alert via AI
-        generated = self.generate_internal_alert(event)
-        if not generated:
-            return
-
-        # Build and preview the BigPanda payload
-        payload = self.build_bigpanda_payload(generated)
-        self.preview_payload(payload, event)
-
-        # Confirm and send
-        self.console.print()
-        if not Confirm.ask("Send this alert to BigPanda?", default=True):
-            if Confirm.ask("Would you like to regenerate the alert?", default=False):
-                generated = self.generate_internal_alert(event)
-                if generated:
-                    payload = self.build_bigpanda_payload(generated)
-                    self.preview_payload(payload, event)
-                    self.console.print()
-                    if not Confirm.ask("Send this alert to BigPanda?", default=True):
-                        self.console.print("[dim]Cancelled.[/dim]")
-                        return
-                else:
-                    return
-            else:
+        # Generate, preview and confirm; a rejected alert may be regenerated
+        for attempt in range(MAX_REGENERATIONS + 1):
+            payload = self._prep_payload(event, refresh=attempt > 0)
+            if not payload:
+                return
+            if self._confirm_send(payload, event):
+                break
+            if attempt == MAX_REGENERATIONS or not Confirm.ask(
+                "Would you like to regenerate the alert?", default=False
+            ):
                 self.console.print("[dim]Cancelled.[/dim]")
                 return
 
@@ -1247,6 +1838,46 @@ class DemoSimulator:
                 "[dim]Use option 2 from the main menu to resolve it when done.[/dim]"
             )
 
+    def _prep_payload(self, event, refresh=False):
+        """Generate the internal alert for event and build its payload. Returns None on failure.
+
+        refresh=True bypasses the LLM cache so a regeneration yields a new alert.
+        """
+        generated = self.generate_internal_alert(event, refresh=refresh)
+        if not generated:
+            return None
+        return self.build_bigpanda_payload(generated)
+
+    def _confirm_send(self, payload, event):
+        """Preview payload and ask whether to send it. Returns True to send."""
+        self.preview_payload(payload, event)
+        self.console.print()
+        return Confirm.ask("Send this alert to BigPanda?", default=True)
+
+    def _generate_and_send_batch(self, events):
+        """Generate alerts for several events at once, then confirm and send each."""
+        generated_list = self.generate_internal_alerts_batch(events)
+
+        sent = 0
+        for event, generated in zip(events, generated_list):
+            if not generated:
+                continue
+            payload = self.build_bigpanda_payload(generated)
+            if not self._confirm_send(payload, event):
+                self.console.print("[dim]Skipped.[/dim]")
+                continue
+            if self.send_to_bigpanda(payload):
+                self.track_sent_alert(payload, event)
+                sent += 1
+
+        self.console.print(
+            f"\n[bold]{sent}/{len(events)} alerts sent and tracked.[/bold]"
+        )
+        if sent:
+            self.console.print(
+                "[dim]Use option 2 from the main menu to resolve them when done.[/dim]"
+            )
+
     # ── Main Entry Point ─────────────────────────────────────────────────
 
     def run(self, resolve_all=False, setup_oim=False):
@@ -1274,6 +1905,8 @@ class DemoSimulator:
 
         # Interactive menu loop
         while True:
+            # Overlap the event fetch with the user's menu choice
+            self._prefetch_events()
             choice = self._show_main_menu()
 
             if choice == "1":
@@ -1281,7 +1914,7 @@ class DemoSimulator:
             elif choice == "2":
                 self.resolve_alerts()
             elif choice == "3":
-                self.show_sent_alerts()
+                self.show_sent_alerts(compact=self._summaries_only())
             elif choice == "4":
                 self.setup_oim_integration()
             elif choice == "5":
@@ -1306,14 +1939,26 @@ def main():
         action="store_true",
         help="Configure the BigPanda OIM integration and exit",
     )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help=(
+            "Print one-line summaries instead of payload previews and sent-alert "
+            "tables (the numbered table for picking alerts to resolve is kept)"
+        ),
+    )
     args = parser.parse_args()
 
+    sim = None
     try:
-        sim = DemoSimulator()
+        sim = DemoSimulator(quiet=args.quiet)
         sim.run(resolve_all=args.resolve_all, setup_oim=args.setup_oim)
     except KeyboardInterrupt:
         print("\n\nInterrupted. Goodbye!")
         sys.exit(0)
+    finally:
+        if sim is not None:
+            sim.close()
 
 
 if __name__ == "__main__":